@@ -1,3 +1,36 @@
-from .client import MixToolsClient
+"""Mix Tools SDK
 
-__all__ = ["MixToolsClient"]
+Public names are loaded lazily on first attribute access so that importing
+the package does not pull in httpx or other heavy dependencies until they
+are actually used. Register new public names in ``_LAZY_IMPORTS``.
+"""
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+from .types import ToolFormat
+
+if TYPE_CHECKING:
+    from .client import MixToolsClient
+    from .recording import RecordingTransport, load_records
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    "MixToolsClient": ".client",
+    "RecordingTransport": ".recording",
+    "load_records": ".recording",
+}
+
+__all__ = ["MixToolsClient", "RecordingTransport", "ToolFormat", "load_records"]
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
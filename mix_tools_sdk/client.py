@@ -1,26 +1,36 @@
 import os
-from typing import Dict, Any, Optional, Literal, List, Union
+from typing import Dict, Any, Optional, List, Union
 import httpx
 
-ToolFormat = Literal["default", "openai", "anthropic", "ollama"]
+from .types import ToolFormat
+
+DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
 
 
 class MixToolsClient:
     """Client for interacting with Mix Tools API"""
 
-    def __init__(self, base_url: str = "https://api.mix.tools", api_key: Optional[str] = None):
+    def __init__(
+        self,
+        base_url: str = "https://api.mix.tools",
+        api_key: Optional[str] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        limits: httpx.Limits = DEFAULT_LIMITS
+    ):
         """
         Initialize the client
 
         Args:
             base_url: Base URL of the Mix Tools API
             api_key: Optional API key for authentication. If not provided, will look for MIXTOOLS_API_KEY environment variable
+            transport: Optional httpx transport to send requests through (e.g. a RecordingTransport)
+            limits: Connection pool limits. Ignored when a transport is given, as the transport owns its pool
         """
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key or os.getenv("MIXTOOLS_API_KEY")
         if not self.api_key:
             raise ValueError("API key must be provided either through constructor or MIXTOOLS_API_KEY environment variable")
-        self.client = httpx.AsyncClient()
+        self.client = httpx.AsyncClient(transport=transport, limits=limits)
 
     async def __aenter__(self):
         return self
@@ -0,0 +1,116 @@
+import json
+import time
+from typing import Dict, Any, Optional, List, IO
+import httpx
+
+
+def _classify(request: httpx.Request) -> Optional[Dict[str, Any]]:
+    """Map an outgoing request onto the client method that issued it"""
+    path = request.url.path.rstrip('/')
+    if request.method == "GET" and path.endswith("/tools"):
+        return {"op": "list_tools"}
+    if request.method == "GET" and path.endswith("/health"):
+        return {"op": "health_check"}
+    if request.method == "POST" and "/tools/" in path:
+        return {"op": "execute_tool", "tool": path.rsplit("/", 1)[-1]}
+    return None
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Transport that records Mix Tools API calls to a JSON Lines file
+
+    Each recorded call is written as one compact JSON object with its start
+    offset (``t``, seconds since the first recorded call), operation, query
+    parameters, request body, payload sizes, response status and latency.
+    Calls that fail in the transport are recorded with a null status and an
+    ``error`` field holding the exception type name, then re-raised.
+    The API key is never written to the file.
+    """
+
+    def __init__(self, path: str, transport: Optional[httpx.AsyncBaseTransport] = None):
+        """
+        Initialize the transport
+
+        Args:
+            path: File to write recorded calls to (overwritten if it exists)
+            transport: Optional transport to forward requests to. Defaults to httpx.AsyncHTTPTransport
+        """
+        self.transport = transport or httpx.AsyncHTTPTransport()
+        self._file: IO[str] = open(path, "w", encoding="utf-8")
+        self._origin: Optional[float] = None
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        record = _classify(request)
+        if record is None:
+            return await self.transport.handle_async_request(request)
+
+        started = time.monotonic()
+        if self._origin is None:
+            self._origin = started
+        try:
+            response = await self.transport.handle_async_request(request)
+            await response.aread()
+        except httpx.HTTPError as e:
+            record.update({"status": None, "error": type(e).__name__})
+            self._write(record, request, started, 0)
+            raise
+        record["status"] = response.status_code
+        self._write(record, request, started, len(response.content))
+        return response
+
+    def _write(self, record: Dict[str, Any], request: httpx.Request, started: float, resp_bytes: int) -> None:
+        elapsed = time.monotonic() - started
+        body = None
+        if request.content:
+            try:
+                body = json.loads(request.content)
+            except ValueError:
+                pass
+        record.update({
+            "t": round(started - self._origin, 3),
+            "params": {k: v for k, v in request.url.params.items() if k != "api_key"},
+            "body": body,
+            "req_bytes": len(request.content),
+            "resp_bytes": resp_bytes,
+            "ms": round(elapsed * 1000, 1),
+        })
+        self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._file.flush()
+
+    async def aclose(self) -> None:
+        self._file.close()
+        await self.transport.aclose()
+
+
+def load_records(path: str) -> List[Any]:
+    """
+    Load calls recorded by RecordingTransport
+
+    Lines that are not valid JSON are returned as None, and records without a
+    numeric ``t`` keep their position relative to the records around them, so
+    that replay can report them instead of rejecting the whole file.
+
+    Args:
+        path: Path to a recording file
+
+    Returns:
+        List of recorded calls ordered by start offset
+    """
+    records: List[Any] = []
+    keys: List[float] = []
+    offset = 0.0
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                record = None
+            t = record.get("t") if isinstance(record, dict) else None
+            if isinstance(t, (int, float)) and not isinstance(t, bool):
+                offset = t
+            records.append(record)
+            keys.append(offset)
+    order = sorted(range(len(records)), key=keys.__getitem__)
+    return [records[i] for i in order]
@@ -0,0 +1,283 @@
+"""Replay recorded Mix Tools traffic and report throughput, latency and errors
+
+Usage::
+
+    mix-tools-replay traffic.jsonl --base-url http://localhost:8000 --rate 2 --concurrency 20
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Any, Iterable, Optional, List, Set
+import httpx
+
+from .client import MixToolsClient
+from .recording import load_records
+
+
+def _percentile(values: List[float], p: float) -> float:
+    """Value at percentile ``p`` (0-100), using nearest rank"""
+    values = sorted(values)
+    if not values:
+        return 0.0
+    rank = max(1, math.ceil(p / 100 * len(values)))
+    return values[rank - 1]
+
+
+@dataclass
+class ReplayResult:
+    """Outcome of a single replayed call
+
+    When pacing, ``latency`` runs from the call's scheduled send time to its
+    completion, so it includes ``wait``, the time spent queued behind the
+    concurrency limit. Unpaced calls have no schedule to fall behind, so their
+    latency runs from the actual send and ``wait`` is None.
+    """
+
+    op: str
+    latency: float
+    error: Optional[str] = None
+    wait: Optional[float] = None
+
+
+@dataclass
+class ReplayReport:
+    """Aggregate statistics for a replay run
+
+    ``results`` holds the calls that were sent; records that could not be
+    replayed are only counted in ``invalid``.
+    """
+
+    results: List[ReplayResult] = field(default_factory=list)
+    duration: float = 0.0
+    invalid: int = 0
+    intended_duration: Optional[float] = None
+    send_duration: float = 0.0
+
+    @property
+    def sent(self) -> int:
+        return len(self.results)
+
+    @property
+    def errors(self) -> int:
+        return sum(1 for result in self.results if result.error is not None)
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.sent if self.sent else 0.0
+
+    @property
+    def throughput(self) -> float:
+        return self.sent / self.duration if self.duration > 0 else 0.0
+
+    @property
+    def intended_rate(self) -> Optional[float]:
+        """Send rate in calls per second that the recorded schedule asked for, None when unpaced"""
+        if not self.intended_duration:
+            return None
+        return self.sent / self.intended_duration
+
+    @property
+    def achieved_rate(self) -> float:
+        """Send rate in calls per second actually reached"""
+        return self.sent / self.send_duration if self.send_duration > 0 else 0.0
+
+    def percentile(self, p: float) -> float:
+        """Latency in seconds at percentile ``p`` (0-100), using nearest rank"""
+        return _percentile([r.latency for r in self.results], p)
+
+    def wait_percentile(self, p: float) -> float:
+        """Queue wait in seconds at percentile ``p`` (0-100), using nearest rank"""
+        return _percentile([r.wait for r in self.results if r.wait is not None], p)
+
+    def to_dict(self) -> Dict[str, Any]:
+        errors_by_kind: Dict[str, int] = {}
+        for result in self.results:
+            if result.error is not None:
+                errors_by_kind[result.error] = errors_by_kind.get(result.error, 0) + 1
+        return {
+            "requests": self.sent,
+            "invalid_records": self.invalid,
+            "duration_s": round(self.duration, 3),
+            "throughput_rps": round(self.throughput, 2),
+            "intended_rps": None if self.intended_rate is None else round(self.intended_rate, 2),
+            "achieved_rps": round(self.achieved_rate, 2),
+            "latency_ms": {
+                f"p{p}": round(self.percentile(p) * 1000, 1) for p in (50, 90, 95, 99)
+            },
+            "queue_wait_ms": {
+                f"p{p}": round(self.wait_percentile(p) * 1000, 1) for p in (50, 99)
+            },
+            "errors": self.errors,
+            "error_rate": round(self.error_rate, 4),
+            "errors_by_kind": errors_by_kind,
+        }
+
+    def summary(self) -> str:
+        data = self.to_dict()
+        latency = ", ".join(f"{k}={v}ms" for k, v in data["latency_ms"].items())
+        wait = ", ".join(f"{k}={v}ms" for k, v in data["queue_wait_ms"].items())
+        intended = "unpaced" if data["intended_rps"] is None else f"{data['intended_rps']} req/s"
+        lines = [
+            f"requests:   {data['requests']} in {data['duration_s']}s"
+            + (f" ({data['invalid_records']} invalid records skipped)" if data["invalid_records"] else ""),
+            f"throughput: {data['throughput_rps']} req/s",
+            f"send rate:  {data['achieved_rps']} req/s (intended: {intended})",
+            f"latency:    {latency}",
+            f"queue wait: {wait}",
+            f"errors:     {data['errors']} ({data['error_rate']:.2%})",
+        ]
+        lines.extend(f"  {kind}: {count}" for kind, count in sorted(data["errors_by_kind"].items()))
+        return "\n".join(lines)
+
+
+def _is_valid(record: Any) -> bool:
+    """Check that a record has everything _dispatch needs"""
+    if not isinstance(record, dict):
+        return False
+    offset = record.get("t")
+    if isinstance(offset, bool) or not isinstance(offset, (int, float)) or offset < 0:
+        return False
+    if not isinstance(record.get("params") or {}, dict) or not isinstance(record.get("body") or {}, dict):
+        return False
+    if record.get("op") == "execute_tool":
+        return isinstance(record.get("tool"), str)
+    return record.get("op") in ("list_tools", "health_check")
+
+
+async def _dispatch(client: MixToolsClient, record: Dict[str, Any]) -> None:
+    params = record.get("params") or {}
+    if record["op"] == "list_tools":
+        await client.list_tools(
+            format=params.get("format"),
+            tags=params.get("tags"),
+            toolkit=params.get("toolkit")
+        )
+    elif record["op"] == "execute_tool":
+        await client.execute_tool(
+            record["tool"],
+            record.get("body") or {},
+            format=params.get("format"),
+            tool_call_id=params.get("tool_call_id")
+        )
+    else:
+        await client.health_check()
+
+
+async def replay(
+    records: Iterable[Any],
+    base_url: str,
+    api_key: str,
+    rate: float = 1.0,
+    concurrency: int = 10,
+    transport: Optional[httpx.AsyncBaseTransport] = None
+) -> ReplayReport:
+    """
+    Replay recorded calls against a Mix Tools server
+
+    Args:
+        records: Calls ordered by start offset, as returned by load_records
+        base_url: Base URL of the server to replay against
+        api_key: API key sent with replayed calls
+        rate: Speed multiplier applied to the recorded timing. 2.0 replays twice as fast; 0 sends calls without pacing
+        concurrency: Maximum number of calls in flight at once. When pacing, time spent waiting for a slot counts towards latency
+        transport: Optional httpx transport, e.g. for replaying against an in-process stand-in. It must allow at least concurrency connections
+
+    Returns:
+        ReplayReport with one result per sent call. Records that cannot be replayed are counted in ReplayReport.invalid
+    """
+    if rate < 0:
+        raise ValueError("rate must not be negative")
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    report = ReplayReport()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    # Size the pool to the concurrency limit so httpx never queues calls
+    # behind its own default of 100 connections
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with MixToolsClient(base_url, api_key=api_key, transport=transport, limits=limits) as client:
+        started = time.monotonic()
+
+        in_flight: Set["asyncio.Task[None]"] = set()
+
+        async def run(record: Dict[str, Any], scheduled: float, sent: float) -> None:
+            error: Optional[str] = None
+            try:
+                await _dispatch(client, record)
+            except httpx.HTTPStatusError as e:
+                error = f"HTTP {e.response.status_code}"
+            except Exception as e:
+                error = type(e).__name__
+            finally:
+                semaphore.release()
+            # When pacing, measure from the scheduled send time so that waiting
+            # for a concurrency slot counts against latency (no coordinated omission)
+            origin, wait = (scheduled, sent - scheduled) if rate else (sent, None)
+            report.results.append(ReplayResult(record["op"], time.monotonic() - origin, error, wait))
+
+        # Start calls one at a time as their offsets come due, so only the
+        # calls in flight hold a task, however long the recording is
+        for record in records:
+            if not _is_valid(record):
+                report.invalid += 1
+                continue
+            scheduled = started + record["t"] / rate if rate else started
+            delay = scheduled - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await semaphore.acquire()
+            sent = time.monotonic()
+            report.send_duration = sent - started
+            if rate:
+                report.intended_duration = max(report.intended_duration or 0.0, record["t"] / rate)
+            task = asyncio.create_task(run(record, scheduled, sent))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+        await asyncio.gather(*in_flight)
+        report.duration = time.monotonic() - started
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point for the ``mix-tools-replay`` command"""
+    parser = argparse.ArgumentParser(
+        prog="mix-tools-replay",
+        description="Replay traffic recorded with RecordingTransport against a Mix Tools server"
+    )
+    parser.add_argument("file", help="Recording file written by RecordingTransport")
+    parser.add_argument("--base-url", default="https://api.mix.tools", help="Server to replay against")
+    parser.add_argument("--api-key", help="API key (defaults to MIXTOOLS_API_KEY)")
+    parser.add_argument("--rate", type=float, default=1.0,
+                        help="Speed multiplier for recorded timing; 0 disables pacing (default: 1.0)")
+    parser.add_argument("--concurrency", type=int, default=10,
+                        help="Maximum calls in flight (default: 10)")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args(argv)
+
+    api_key = args.api_key or os.getenv("MIXTOOLS_API_KEY")
+    if not api_key:
+        parser.error("API key must be provided either through --api-key or MIXTOOLS_API_KEY environment variable")
+    if args.rate < 0:
+        parser.error("--rate must not be negative")
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+
+    try:
+        records = load_records(args.file)
+    except OSError as e:
+        parser.error(f"cannot read {args.file}: {e.strerror or e}")
+    except UnicodeDecodeError as e:
+        parser.error(f"{args.file} is not a valid recording: {e}")
+    report = asyncio.run(replay(records, args.base_url, api_key, args.rate, args.concurrency))
+    print(json.dumps(report.to_dict(), indent=2) if args.json else report.summary())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
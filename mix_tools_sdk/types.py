@@ -0,0 +1,3 @@
+from typing import Literal
+
+ToolFormat = Literal["default", "openai", "anthropic", "ollama"]
@@ -0,0 +1,45 @@
+import subprocess
+import sys
+import pytest
+
+# Cumulative import time allowed for `import mix_tools_sdk`, in microseconds.
+# Importing httpx alone costs several times this budget.
+IMPORT_TIME_BUDGET_US = 20_000
+
+HEAVY_MODULES = ["httpx", "pydantic", "mix_tools_sdk.client", "mix_tools_sdk.recording"]
+
+def run_python(*args):
+    return subprocess.run([sys.executable, *args], capture_output=True, text=True, check=True)
+
+def test_import_does_not_load_heavy_modules():
+    """Test that importing the package defers httpx and pydantic"""
+    result = run_python(
+        "-c",
+        "import sys, mix_tools_sdk; print(','.join(m for m in %r if m in sys.modules))" % HEAVY_MODULES
+    )
+    assert result.stdout.strip() == ""
+
+def test_lazy_attribute_loads_module():
+    """Test that public names resolve on first access"""
+    result = run_python(
+        "-c",
+        "import sys, mix_tools_sdk; mix_tools_sdk.MixToolsClient; print('mix_tools_sdk.client' in sys.modules)"
+    )
+    assert result.stdout.strip() == "True"
+
+def test_import_time_budget():
+    """Test that `import mix_tools_sdk` stays within its import-time budget"""
+    result = run_python("-X", "importtime", "-c", "import mix_tools_sdk")
+    cumulative = None
+    for line in result.stderr.splitlines():
+        fields = [field.strip() for field in line.split("|")]
+        if len(fields) == 3 and fields[2] == "mix_tools_sdk":
+            cumulative = int(fields[1])
+    assert cumulative is not None, result.stderr
+    assert cumulative < IMPORT_TIME_BUDGET_US, f"import mix_tools_sdk took {cumulative}us"
+
+def test_unknown_attribute_raises():
+    """Test that unknown attributes still raise AttributeError"""
+    import mix_tools_sdk
+    with pytest.raises(AttributeError, match="does_not_exist"):
+        mix_tools_sdk.does_not_exist
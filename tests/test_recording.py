@@ -0,0 +1,283 @@
+import asyncio
+import json
+import time
+import pytest
+import httpx
+from mix_tools_sdk import MixToolsClient, RecordingTransport, load_records
+from mix_tools_sdk.replay import replay, main, ReplayReport, ReplayResult
+
+def mock_handler(request):
+    """Stand-in Mix Tools server"""
+    if request.url.path == "/tools":
+        return httpx.Response(200, json={"tools": [{"name": "test_tool"}]})
+    if request.url.path == "/tools/missing_tool":
+        return httpx.Response(404, json={"detail": "Tool not found"})
+    if request.url.path.startswith("/tools/"):
+        return httpx.Response(200, json={"result": json.loads(request.content)})
+    return httpx.Response(200, json={"status": "healthy"})
+
+@pytest.fixture
+def recording(tmp_path):
+    """Path to write recorded traffic to"""
+    return str(tmp_path / "traffic.jsonl")
+
+@pytest.mark.asyncio
+async def test_recording_transport_records_calls(recording):
+    """Test that list_tools and execute_tool calls are recorded"""
+    transport = RecordingTransport(recording, httpx.MockTransport(mock_handler))
+    async with MixToolsClient("http://test-api", api_key="secret-key", transport=transport) as client:
+        tools = await client.list_tools(format="openai", tags=["a", "b"])
+        result = await client.execute_tool("test_tool", {"input": "test"}, tool_call_id="call-1")
+    assert tools["tools"][0]["name"] == "test_tool"
+    assert result["result"] == {"input": "test"}
+
+    records = load_records(recording)
+    assert [record["op"] for record in records] == ["list_tools", "execute_tool"]
+    assert records[0]["params"] == {"format": "openai", "tags": "a,b"}
+    assert records[0]["t"] == 0
+    assert records[0]["resp_bytes"] > 0
+    assert records[1]["tool"] == "test_tool"
+    assert records[1]["body"] == {"input": "test"}
+    assert records[1]["params"] == {"tool_call_id": "call-1"}
+    assert records[1]["status"] == 200
+    with open(recording) as f:
+        assert "secret-key" not in f.read()
+
+@pytest.mark.asyncio
+async def test_recording_transport_records_failed_calls(recording):
+    """Test that calls failing in the transport are recorded and re-raised"""
+    def failing_handler(request):
+        raise httpx.ConnectError("connection refused", request=request)
+    transport = RecordingTransport(recording, httpx.MockTransport(failing_handler))
+    async with MixToolsClient("http://test-api", api_key="test-api-key", transport=transport) as client:
+        with pytest.raises(httpx.ConnectError):
+            await client.list_tools()
+
+    records = load_records(recording)
+    assert len(records) == 1
+    assert records[0]["op"] == "list_tools"
+    assert records[0]["status"] is None
+    assert records[0]["error"] == "ConnectError"
+    assert records[0]["resp_bytes"] == 0
+    assert "ms" in records[0]
+
+@pytest.mark.asyncio
+async def test_replay_reports_latency_and_errors(recording):
+    """Test replaying recorded calls against a stand-in server"""
+    records = [
+        {"t": 0, "op": "list_tools", "params": {"toolkit": "arxiv"}},
+        {"t": 0, "op": "execute_tool", "tool": "test_tool", "params": {}, "body": {"input": "test"}},
+        {"t": 0, "op": "execute_tool", "tool": "missing_tool", "params": {}, "body": {}},
+        {"t": 0, "op": "health_check", "params": {}},
+    ]
+    report = await replay(
+        records,
+        "http://test-api",
+        api_key="test-api-key",
+        rate=0,
+        concurrency=2,
+        transport=httpx.MockTransport(mock_handler)
+    )
+    assert report.sent == 4
+    assert report.errors == 1
+    assert report.error_rate == 0.25
+    assert report.to_dict()["errors_by_kind"] == {"HTTP 404": 1}
+
+@pytest.mark.asyncio
+async def test_replay_reports_invalid_records():
+    """Test that malformed records are reported instead of stopping the run"""
+    records = [
+        {"t": 0, "op": "execute_tool", "params": {}},
+        {"t": "soon", "op": "list_tools"},
+        {"t": 0, "op": "delete_tool"},
+        ["not", "a", "record"],
+        {"t": 0, "op": "list_tools", "params": {}},
+    ]
+    report = await replay(
+        records,
+        "http://test-api",
+        api_key="test-api-key",
+        rate=0,
+        transport=httpx.MockTransport(mock_handler)
+    )
+    assert report.sent == 1
+    assert report.invalid == 4
+    data = report.to_dict()
+    assert data["requests"] == 1
+    assert data["invalid_records"] == 4
+    assert data["errors"] == 0
+    assert data["error_rate"] == 0
+    assert report.throughput == pytest.approx(1 / report.duration)
+
+@pytest.mark.asyncio
+async def test_replay_honors_scaled_offsets():
+    """Test that recorded offsets are replayed divided by the rate"""
+    sent_at = []
+    def timing_handler(request):
+        sent_at.append(time.monotonic())
+        return mock_handler(request)
+    records = [{"t": t, "op": "health_check", "params": {}} for t in (0, 0.2, 0.4)]
+    report = await replay(
+        records,
+        "http://test-api",
+        api_key="test-api-key",
+        rate=2.0,
+        transport=httpx.MockTransport(timing_handler)
+    )
+    offsets = [t - sent_at[0] for t in sent_at]
+    assert offsets == pytest.approx([0, 0.1, 0.2], abs=0.05)
+    assert report.intended_duration == pytest.approx(0.2)
+    assert report.to_dict()["intended_rps"] == 15.0
+    assert report.achieved_rate == pytest.approx(15.0, rel=0.3)
+
+@pytest.mark.asyncio
+async def test_replay_latency_includes_queue_wait():
+    """Test that waiting for a concurrency slot counts against latency"""
+    async def slow_handler(request):
+        await asyncio.sleep(0.05)
+        return mock_handler(request)
+    records = [{"t": 0, "op": "health_check", "params": {}} for _ in range(3)]
+    report = await replay(
+        records,
+        "http://test-api",
+        api_key="test-api-key",
+        rate=1.0,
+        concurrency=1,
+        transport=httpx.MockTransport(slow_handler)
+    )
+    assert report.percentile(100) >= 0.15
+    assert report.wait_percentile(100) >= 0.1
+    assert report.to_dict()["intended_rps"] is None
+
+@pytest.mark.asyncio
+async def test_replay_unpaced_latency_is_service_time():
+    """Test that unpaced latency is measured from the actual send"""
+    async def slow_handler(request):
+        await asyncio.sleep(0.01)
+        return mock_handler(request)
+    records = [{"t": 0, "op": "health_check", "params": {}} for _ in range(50)]
+    report = await replay(
+        records,
+        "http://test-api",
+        api_key="test-api-key",
+        rate=0,
+        concurrency=5,
+        transport=httpx.MockTransport(slow_handler)
+    )
+    assert report.percentile(50) == pytest.approx(0.01, abs=0.02)
+    assert report.wait_percentile(99) == 0.0
+
+@pytest.mark.asyncio
+async def test_replay_sizes_connection_pool_to_concurrency(monkeypatch):
+    """Test that concurrency above httpx's default pool size is not capped"""
+    created = []
+    def spy_client(*args, **kwargs):
+        created.append(kwargs)
+        return MixToolsClient(*args, **kwargs)
+    monkeypatch.setattr("mix_tools_sdk.replay.MixToolsClient", spy_client)
+    await replay([], "http://test-api", api_key="test-api-key", concurrency=250)
+    assert created[0]["limits"].max_connections == 250
+    assert created[0]["limits"].max_keepalive_connections == 250
+
+@pytest.mark.asyncio
+async def test_replay_schedules_calls_incrementally():
+    """Test that only calls in flight hold a task, however many records there are"""
+    task_counts = []
+    def records():
+        for _ in range(200):
+            task_counts.append(len(asyncio.all_tasks()))
+            yield {"t": 0, "op": "health_check", "params": {}}
+    report = await replay(
+        records(),
+        "http://test-api",
+        api_key="test-api-key",
+        rate=0,
+        concurrency=5,
+        transport=httpx.MockTransport(mock_handler)
+    )
+    assert report.sent == 200
+    # The test's own task plus at most `concurrency` calls
+    assert max(task_counts) <= 6
+
+@pytest.mark.asyncio
+async def test_replay_rejects_invalid_concurrency():
+    """Test that replay validates its concurrency"""
+    with pytest.raises(ValueError, match="concurrency"):
+        await replay([], "http://test-api", api_key="test-api-key", concurrency=0)
+
+def test_report_percentiles():
+    """Test nearest-rank latency percentiles"""
+    report = ReplayReport([ReplayResult("list_tools", i / 100) for i in range(1, 101)], duration=2.0)
+    assert report.percentile(50) == 0.5
+    assert report.percentile(99) == 0.99
+    assert report.throughput == 50.0
+    assert ReplayReport().percentile(50) == 0.0
+
+def test_main_requires_api_key(recording, monkeypatch):
+    """Test that the CLI refuses to run without an API key"""
+    monkeypatch.delenv("MIXTOOLS_API_KEY", raising=False)
+    with pytest.raises(SystemExit):
+        main([recording])
+
+def test_main_rejects_missing_recording(tmp_path, capsys):
+    """Test that a missing recording produces a usage error"""
+    with pytest.raises(SystemExit) as exc_info:
+        main([str(tmp_path / "traffic.jsonl"), "--api-key", "test-api-key"])
+    assert exc_info.value.code == 2
+    assert "cannot read" in capsys.readouterr().err
+
+def test_load_records_keeps_malformed_lines(recording):
+    """Test that malformed lines are loaded in place instead of failing the file"""
+    with open(recording, "w") as f:
+        f.write('{"t":0.2,"op":"health_check"}\n')
+        f.write('[1,2]\n')
+        f.write('{"t":0.1,"op":"list_tools"}\n')
+        f.write('{"op":"list_tools"}\n')
+        f.write('not json\n')
+    records = load_records(recording)
+    assert records == [
+        {"t": 0.1, "op": "list_tools"},
+        {"op": "list_tools"},
+        None,
+        {"t": 0.2, "op": "health_check"},
+        [1, 2],
+    ]
+
+@pytest.fixture
+def mock_cli_client(monkeypatch):
+    """Route CLI replays to the stand-in server"""
+    def mock_client(*args, **kwargs):
+        kwargs["transport"] = httpx.MockTransport(mock_handler)
+        return MixToolsClient(*args, **kwargs)
+    monkeypatch.setattr("mix_tools_sdk.replay.MixToolsClient", mock_client)
+
+def test_main_prints_json_report(recording, mock_cli_client, capsys):
+    """Test a full CLI run against a stand-in server"""
+    with open(recording, "w") as f:
+        f.write('{"t":0,"op":"list_tools","params":{}}\n')
+        f.write('{"t":0.01,"op":"execute_tool","tool":"test_tool","params":{},"body":{"input":"test"}}\n')
+
+    assert main([recording, "--api-key", "test-api-key", "--base-url", "http://test-api", "--json"]) == 0
+    report = json.loads(capsys.readouterr().out)
+    assert set(report) == {
+        "requests", "invalid_records", "duration_s", "throughput_rps", "intended_rps", "achieved_rps",
+        "latency_ms", "queue_wait_ms", "errors", "error_rate", "errors_by_kind",
+    }
+    assert report["requests"] == 2
+    assert report["errors"] == 0
+    assert set(report["latency_ms"]) == {"p50", "p90", "p95", "p99"}
+
+def test_main_reports_invalid_records(recording, mock_cli_client, capsys):
+    """Test that the CLI replays valid records and counts the rest as invalid"""
+    with open(recording, "w") as f:
+        f.write('{"t":0,"op":"list_tools","params":{}}\n')
+        f.write('[1,2]\n')
+        f.write('{"t":"soon","op":"health_check"}\n')
+        f.write('not json\n')
+        f.write('{"t":0.01,"op":"health_check","params":{}}\n')
+
+    assert main([recording, "--api-key", "test-api-key", "--base-url", "http://test-api", "--json"]) == 0
+    report = json.loads(capsys.readouterr().out)
+    assert report["requests"] == 2
+    assert report["invalid_records"] == 3
+    assert report["errors"] == 0